@@ -15,11 +15,24 @@ Usage:
 import argparse
 import json
 import math
-import re
+import zlib
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import combinations
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: falls back to parsing the whole file
+    ijson = None
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 DEFAULT_INPUT = SCRIPT_DIR / "papers-db.json"
 DEFAULT_OUTPUT_DIR = SCRIPT_DIR / "v2" / "data"
@@ -66,6 +79,28 @@ THREAD_META = {
 
 THREAD_ORDER = list(THREAD_META.keys())
 
+# Paper fields read by the analysis; everything else in papers-db.json is dropped on load.
+PAPER_FIELDS = (
+    "id",
+    "openalex_id",
+    "aliases",
+    "tags",
+    "authors",
+    "referenced_works",
+    "cited_by_count",
+    "relevance_score",
+    "year",
+    "title",
+    "doi",
+    "arxiv_id",
+    "url",
+    "venue",
+)
+
+# List fields that may be missing or null in papers-db.json; loading turns them
+# into concrete lists so the analysis can index them directly.
+LIST_FIELDS = ("aliases", "tags", "authors", "referenced_works")
+
 # Priority for thread assignment when a paper has multiple tags
 THREAD_PRIORITY = {t: i for i, t in enumerate(THREAD_ORDER)}
 
@@ -74,11 +109,58 @@ def now_iso():
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def load_json(path):
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(path, data):
+    """Write compact UTF-8 JSON followed by a newline in a single write.
+
+    The orjson and json paths produce the same bytes (non-ASCII unescaped),
+    apart from floats below 1e-4 or from 1e16 up, which the outputs don't use.
+    """
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+        return
+    text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    Path(path).write_text(text + "\n", encoding="utf-8")
+
+
+def iter_papers(path):
+    """Yield paper rows from papers-db.json, keeping only PAPER_FIELDS.
+
+    Streams the file with ijson when installed so the full database is never
+    materialized; otherwise parses it in one go.
+    """
+    if ijson is not None:
+        with open(path, "rb") as f:
+            for row in ijson.items(f, "papers.item", use_float=True):
+                yield _project_paper(row)
+        return
+    for row in load_json(path).get("papers", []):
+        yield _project_paper(row)
+
+
+def _project_paper(row):
+    paper = {k: row[k] for k in PAPER_FIELDS if k in row}
+    for k in LIST_FIELDS:
+        paper[k] = row.get(k) or []
+    return paper
+
+
 def short_openalex_id(oa_id):
     if not oa_id:
         return None
-    m = re.search(r"/([AW]\d+)$", oa_id.strip())
-    return m.group(1) if m else oa_id.strip()
+    value = oa_id.strip()
+    # Equivalent to matching r"/([AW]\d+)$" but without a regex call per ID.
+    tail = value.rpartition("/")[2]
+    if tail[:1] in ("A", "W") and tail[1:].isdecimal():
+        return tail
+    return value
 
 
 def assign_thread(paper):
@@ -86,7 +168,12 @@ def assign_thread(paper):
 
     Prefers specific subfields over the broad 'classical_calcvar' fallback.
     """
-    tags = paper.get("tags") or []
+    return _thread_for_tags(tuple(paper["tags"]))
+
+
+@lru_cache(maxsize=None)
+def _thread_for_tags(tags):
+    # Papers share a small number of distinct tag lists, so cache per list.
     if not tags:
         return "classical_calcvar"
 
@@ -104,51 +191,137 @@ def assign_thread(paper):
     return "classical_calcvar"
 
 
-def compute_influence(paper, in_corpus_citations, max_citations, max_relevance):
-    """Compute influence score for a paper.
+def compute_influence(papers, in_corpus_citations):
+    """Compute influence scores for all papers in one pass.
 
     Formula:
       40% citation count (log-scaled, normalized)
       30% relevance score (normalized)
       20% in-corpus citation count (log-scaled)
       10% recency bonus
+
+    Returns a list of scores aligned with `papers`.
     """
-    cited = paper.get("cited_by_count") or 0
-    relevance = paper.get("relevance_score") or 0
-    in_corpus = in_corpus_citations.get(paper["id"], 0)
-    year = paper.get("year") or 1950
+    max_citations = max((p.get("cited_by_count") or 0) for p in papers)
+    max_relevance = max((p.get("relevance_score") or 0) for p in papers)
+
+    # Normalizers are shared by every paper, so compute them once.
+    cite_denom = math.log1p(max(max_citations, 1))
+    rel_denom = max(max_relevance, 1.0)
+    # In-corpus citation (log scale, capped at 1.0). Counts are integers and the
+    # term saturates at 50, so tabulate it once instead of per paper.
+    in_corpus_cap = 50
+    in_corpus_norms = [
+        min(math.log1p(n) / math.log1p(in_corpus_cap), 1.0)
+        for n in range(in_corpus_cap + 1)
+    ]
+    # Recency bonus (papers from last 10 years get bonus)
+    current_year = 2025
+    recency_start = current_year - 30
 
-    # Normalize citation count (log scale)
-    cite_norm = math.log1p(cited) / math.log1p(max(max_citations, 1))
+    scores = []
+    for paper in papers:
+        cited = paper.get("cited_by_count") or 0
+        relevance = paper.get("relevance_score") or 0
+        in_corpus = in_corpus_citations.get(paper["id"], 0)
+        year = paper.get("year") or 1950
 
-    # Normalize relevance
-    rel_norm = relevance / max(max_relevance, 1.0)
+        cite_norm = math.log1p(cited) / cite_denom
+        rel_norm = relevance / rel_denom
+        in_corpus_norm = in_corpus_norms[min(in_corpus, in_corpus_cap)]
+        recency = max(0, min(1.0, (year - recency_start) / 30))
 
-    # In-corpus citation (log scale, cap at reasonable value)
-    in_corpus_norm = math.log1p(in_corpus) / math.log1p(50)
-    in_corpus_norm = min(in_corpus_norm, 1.0)
+        inf = 0.4 * cite_norm + 0.3 * rel_norm + 0.2 * in_corpus_norm + 0.1 * recency
+        scores.append(round(inf, 4))
+    return scores
 
-    # Recency bonus (papers from last 10 years get bonus)
-    current_year = 2025
-    recency = max(0, min(1.0, (year - (current_year - 30)) / 30))
 
-    inf = 0.4 * cite_norm + 0.3 * rel_norm + 0.2 * in_corpus_norm + 0.1 * recency
-    return round(inf, 4)
+def build_citation_graph(papers, in_corpus_refs):
+    """Build citation edges between papers in the corpus.
 
+    `in_corpus_refs` maps each paper ID to the corpus papers it cites, as
+    resolved while counting in-corpus citations. Returns a list of
+    (source_id, target_id) tuples in the order of `papers`; the JSON edge
+    dicts are only built for the subsets that get written out.
+    """
+    return [
+        (paper["id"], target_id)
+        for paper in papers
+        for target_id in in_corpus_refs.get(paper["id"], ())
+    ]
 
-def build_citation_graph(papers, oa_id_to_paper_id):
-    """Build citation edges between papers in the corpus."""
-    edges = []
-    paper_ids = {p["id"] for p in papers}
 
-    for paper in papers:
-        source_id = paper["id"]
-        for ref_oa in paper.get("referenced_works") or []:
-            target_id = oa_id_to_paper_id.get(ref_oa)
-            if target_id and target_id in paper_ids and target_id != source_id:
-                edges.append({"source": source_id, "target": target_id})
+def aggregate_authors(papers):
+    """Aggregate per-author stats over papers sorted by influence (descending).
 
-    return edges
+    Returns {author: record}. One pass fills every field, so "tops" is simply
+    the first ten papers seen for each author.
+    """
+    author_records = {}
+    for paper in papers:
+        pid = paper["id"]
+        year = paper.get("year")
+        thread = paper["_thread"]
+        cited = paper.get("cited_by_count") or 0
+        inf = paper["_influence"]
+        authors_list = paper["authors"]
+        for author in authors_list:
+            rec = author_records.get(author)
+            if rec is None:
+                rec = author_records[author] = {
+                    "pc": 0,
+                    "cc": 0,
+                    "inf": 0.0,
+                    "years": set(),
+                    "threads": Counter(),
+                    "tops": [],
+                    "co": Counter(),
+                }
+            rec["pc"] += 1
+            rec["cc"] += cited
+            rec["inf"] += inf
+            if year:
+                rec["years"].add(year)
+            rec["threads"][thread] += 1
+            if len(rec["tops"]) < 10:
+                rec["tops"].append(pid)
+        # Each co-author pair once per paper, credited to both sides.
+        for a, b in combinations(dict.fromkeys(authors_list), 2):
+            author_records[a]["co"][b] += 1
+            author_records[b]["co"][a] += 1
+    return author_records
+
+
+def merge_author_records(records, other):
+    """Merge records aggregated over a later slice of papers into `records`."""
+    for author, rec in other.items():
+        mine = records.get(author)
+        if mine is None:
+            records[author] = rec
+            continue
+        mine["pc"] += rec["pc"]
+        mine["cc"] += rec["cc"]
+        mine["inf"] += rec["inf"]
+        mine["years"] |= rec["years"]
+        mine["threads"].update(rec["threads"])
+        mine["tops"].extend(rec["tops"][:10 - len(mine["tops"])])
+        mine["co"].update(rec["co"])
+    return records
+
+
+def aggregate_authors_parallel(papers, workers):
+    """Run aggregate_authors over contiguous slices in worker processes.
+
+    Slices are merged in order, so paper order (and with it "tops" and the
+    Counter tie order) is the same as a serial run.
+    """
+    size = -(-len(papers) // workers)
+    slices = [papers[i:i + size] for i in range(0, len(papers), size)]
+    author_records = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(aggregate_authors, slices):
+            merge_author_records(author_records, part)
+    return author_records
 
 
 def build_coauthor_network(papers, author_influence):
@@ -157,14 +330,13 @@ def build_coauthor_network(papers, author_influence):
     author_set = set()
 
     for paper in papers:
-        authors = paper.get("authors") or []
-        for a in authors:
-            author_set.add(a)
-        # All pairs of authors on a paper
-        for i in range(len(authors)):
-            for j in range(i + 1, len(authors)):
-                pair = tuple(sorted([authors[i], authors[j]]))
-                coauthor_weights[pair] += 1
+        # Distinct authors in listed order: pairs are first counted in the same
+        # order as before, which keeps most_common()'s tie order for the edges.
+        authors = list(dict.fromkeys(paper["authors"]))
+        author_set.update(authors)
+        coauthor_weights.update(
+            (a, b) if a < b else (b, a) for a, b in combinations(authors, 2)
+        )
 
     # Build nodes (only authors with at least some influence)
     nodes = []
@@ -200,11 +372,15 @@ def compute_warm_positions(papers, thread_order):
 
     positions = {}
     for paper in papers:
+        pid = paper["id"]
         year = paper.get("year") or 2000
         thread = paper.get("_thread", "classical_calcvar")
         x = ((year - year_min) / year_range) * 800 - 400
-        y = thread_y.get(thread, 0) + (hash(paper["id"]) % 60 - 30)
-        positions[paper["id"]] = (round(x, 1), round(y, 1))
+        # crc32 rather than hash(): str hashes are salted per process, which
+        # made the jitter (and graph.json) change on every run.
+        jitter = zlib.crc32(pid.encode()) % 60 - 30
+        y = thread_y.get(thread, 0) + jitter
+        positions[pid] = (round(x, 1), round(y, 1))
 
     return positions
 
@@ -214,6 +390,12 @@ def main():
     parser.add_argument("--input", default=str(DEFAULT_INPUT), help="Input papers-db.json")
     parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="Output directory")
     parser.add_argument("--top-papers", type=int, default=800, help="Max papers in core.json")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for author aggregation (default 1: serial, no IPC overhead)",
+    )
     args = parser.parse_args()
 
     input_path = Path(args.input)
@@ -221,64 +403,68 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"Loading {input_path}...")
-    with open(input_path) as f:
-        db = json.load(f)
 
-    papers = db.get("papers", [])
-    print(f"  {len(papers)} papers loaded")
-
-    if not papers:
-        print("No papers found. Run build_papers_db.py first.")
-        return
-
-    # --- Build OpenAlex ID → paper ID lookup ---
+    # --- Load papers and build OpenAlex ID → paper ID lookup in one pass ---
+    papers = []
     oa_id_to_paper_id = {}
-    for p in papers:
+    for p in iter_papers(input_path):
+        papers.append(p)
+        pid = p["id"]
         oa = p.get("openalex_id")
+        short = None
         if oa:
+            # Already-short IDs would otherwise be written twice.
             short = short_openalex_id(oa)
-            if short:
-                oa_id_to_paper_id[short] = p["id"]
-            oa_id_to_paper_id[oa] = p["id"]
-        # Also map aliases
-        for alias in p.get("aliases") or []:
+            if short and short != oa:
+                oa_id_to_paper_id[short] = pid
+            oa_id_to_paper_id[oa] = pid
+        # Also map aliases (skipping the one this paper was just mapped under)
+        for alias in p["aliases"]:
             if alias.startswith("openalex:"):
-                oa_short = short_openalex_id(alias.replace("openalex:", ""))
-                if oa_short:
-                    oa_id_to_paper_id[oa_short] = p["id"]
+                oa_short = short_openalex_id(alias[len("openalex:"):])
+                if oa_short and oa_short != short:
+                    oa_id_to_paper_id[oa_short] = pid
+
+    print(f"  {len(papers)} papers loaded")
+
+    if not papers:
+        print("No papers found. Run build_papers_db.py first.")
+        return
 
     # --- Assign threads ---
     for paper in papers:
         paper["_thread"] = assign_thread(paper)
 
     # --- Compute in-corpus citations and refs ---
-    paper_ids = {p["id"] for p in papers}
-    in_corpus_citations = Counter()
+    # Every value in oa_id_to_paper_id is the id of a loaded paper, so a hit
+    # is already known to be in the corpus.
+    in_corpus_citations = defaultdict(int)
     in_corpus_refs = defaultdict(list)
     for paper in papers:
-        for ref_oa in paper.get("referenced_works") or []:
+        for ref_oa in paper["referenced_works"]:
             target_id = oa_id_to_paper_id.get(ref_oa)
-            if target_id and target_id in paper_ids and target_id != paper["id"]:
+            if target_id and target_id != paper["id"]:
                 in_corpus_citations[target_id] += 1
                 in_corpus_refs[paper["id"]].append(target_id)
 
     # --- Compute influence ---
-    max_citations = max((p.get("cited_by_count") or 0) for p in papers) if papers else 1
-    max_relevance = max((p.get("relevance_score") or 0) for p in papers) if papers else 1.0
-
-    for paper in papers:
-        paper["_influence"] = compute_influence(
-            paper, in_corpus_citations, max_citations, max_relevance
-        )
+    influence = compute_influence(papers, in_corpus_citations)
+    for paper, inf in zip(papers, influence):
+        paper["_influence"] = inf
 
     # Sort by influence descending
     papers.sort(key=lambda p: -p["_influence"])
 
+    # Bucket papers by thread once; each bucket keeps the influence order.
+    papers_by_thread = defaultdict(list)
+    for p in papers:
+        papers_by_thread[p["_thread"]].append(p)
+
     # --- Build thread stats ---
     thread_stats = {}
     for tid in THREAD_ORDER:
         meta = THREAD_META[tid]
-        thread_papers = [p for p in papers if p["_thread"] == tid]
+        thread_papers = papers_by_thread.get(tid, [])
 
         # Yearly counts
         yearly = Counter()
@@ -289,107 +475,84 @@ def main():
 
         year_min = min(yearly.keys()) if yearly else 1950
         year_max = max(yearly.keys()) if yearly else 2025
-        yc = []
-        for y in range(year_min, year_max + 1):
-            yc.append({"y": y, "c": yearly.get(y, 0)})
+        yc = [{"y": y, "c": yearly.get(y, 0)} for y in range(year_min, year_max + 1)]
 
         # Thread authors and key authors
         thread_author_counts = Counter()
         for p in thread_papers:
-            for a in p.get("authors") or []:
+            for a in p["authors"]:
                 thread_author_counts[a] += 1
 
-        # Top papers by influence
-        thread_top_papers = sorted(thread_papers, key=lambda x: -x["_influence"])
-
         thread_stats[tid] = {
             "n": meta["name"],
             "d": meta["description"],
             "tc": len(thread_papers),
             "yc": yc,
-            "py": max(yearly, key=yearly.get) if yearly else None,
+            "py": yearly.most_common(1)[0][0] if yearly else None,
             "ac": len(thread_author_counts),
             "ka": dict(thread_author_counts.most_common(15)),
-            "tops": [p["id"] for p in thread_top_papers[:15]],
+            # Buckets inherit the influence order of `papers`.
+            "tops": [p["id"] for p in thread_papers[:15]],
         }
 
     # --- Build author stats ---
-    author_papers = defaultdict(list)
-    author_citations = Counter()
-    author_influence = defaultdict(float)
-    author_years = defaultdict(set)
-    author_threads = defaultdict(Counter)
-    author_coauthors = defaultdict(Counter)
-
-    for paper in papers:
-        year = paper.get("year")
-        thread = paper["_thread"]
-        authors_list = paper.get("authors") or []
-        for author in authors_list:
-            author_papers[author].append(paper["id"])
-            author_citations[author] += paper.get("cited_by_count") or 0
-            author_influence[author] += paper["_influence"]
-            if year:
-                author_years[author].add(year)
-            author_threads[author][thread] += 1
-            for coauthor in authors_list:
-                if coauthor != author:
-                    author_coauthors[author][coauthor] += 1
-
-    # Build author top papers (papers already sorted by influence desc)
-    author_top_papers = defaultdict(list)
-    for paper in papers:
-        for author in paper.get("authors") or []:
-            if len(author_top_papers[author]) < 10:
-                author_top_papers[author].append(paper["id"])
+    if args.workers > 1:
+        author_records = aggregate_authors_parallel(papers, args.workers)
+    else:
+        author_records = aggregate_authors(papers)
 
     authors_data = {}
-    for author in sorted(author_papers.keys()):
+    for author in sorted(author_records):
+        rec = author_records[author]
         authors_data[author] = {
             "u": author,
-            "pc": len(author_papers[author]),
-            "inf": round(author_influence[author], 4),
-            "cc": author_citations[author],
-            "yrs": sorted(author_years.get(author, [])),
-            "ths": dict(author_threads.get(author, {})),
-            "tops": author_top_papers.get(author, []),
-            "co": dict(author_coauthors.get(author, Counter()).most_common(20)),
+            "pc": rec["pc"],
+            "inf": round(rec["inf"], 4),
+            "cc": rec["cc"],
+            "yrs": sorted(rec["years"]),
+            "ths": dict(rec["threads"]),
+            "tops": rec["tops"],
+            "co": dict(rec["co"].most_common(20)),
         }
+    author_influence = {author: rec["inf"] for author, rec in author_records.items()}
 
     # --- Build citation graph ---
     print("Building citation graph...")
-    citation_edges = build_citation_graph(papers, oa_id_to_paper_id)
+    citation_edges = build_citation_graph(papers, in_corpus_refs)
     print(f"  {len(citation_edges)} citation edges")
 
     # --- Top papers for core.json ---
     top_papers = papers[:args.top_papers]
     core_papers = {}
     for p in top_papers:
+        # Bind p.get once; these loops build one dict per output paper.
+        g = p.get
         pid = p["id"]
-        year = p.get("year")
+        year = g("year")
         date_str = f"{year}-01-01" if year else "2000-01-01"
         core_papers[pid] = {
             "id": pid,
-            "t": p.get("title", ""),
-            "a": (p.get("authors") or [])[:10],  # cap authors
+            "t": g("title", ""),
+            "a": p["authors"][:10],  # cap authors
             "d": date_str,
             "inf": p["_influence"],
             "th": p["_thread"],
-            "cc": p.get("cited_by_count") or 0,
+            "cc": g("cited_by_count") or 0,
             "ref": in_corpus_refs.get(pid, []),
-            "tags": p.get("tags") or [],
+            "tags": p["tags"],
             "icc": in_corpus_citations.get(pid, 0),
         }
 
     # Graph nodes/edges for core.json (subset of top papers)
     top_ids = set(core_papers.keys())
     core_graph_edges = [
-        e for e in citation_edges
-        if e["source"] in top_ids and e["target"] in top_ids
+        {"source": src, "target": tgt}
+        for src, tgt in citation_edges
+        if src in top_ids and tgt in top_ids
     ]
     core_graph_nodes = [
         {"id": pid, "type": "paper"}
-        for pid in top_ids
+        for pid in core_papers
     ]
 
     # --- Write core.json ---
@@ -411,29 +574,28 @@ def main():
     }
 
     core_path = output_dir / "core.json"
-    with open(core_path, "w") as f:
-        json.dump(core_data, f, separators=(",", ":"), ensure_ascii=True)
-        f.write("\n")
+    write_json(core_path, core_data)
     print(f"Written: {core_path} ({len(core_papers)} papers, {len(core_graph_edges)} edges)")
 
     # --- Write papers.json ---
     papers_dict = {}
     for p in papers:
+        g = p.get
         pid = p["id"]
         entry = {
             "id": pid,
-            "t": p.get("title", ""),
-            "a": (p.get("authors") or [])[:10],
-            "y": p.get("year"),
-            "c": p.get("cited_by_count") or 0,
+            "t": g("title", ""),
+            "a": p["authors"][:10],
+            "y": g("year"),
+            "c": g("cited_by_count") or 0,
             "inf": p["_influence"],
-            "rel": p.get("relevance_score") or 0,
+            "rel": g("relevance_score") or 0,
             "th": p["_thread"],
-            "tags": p.get("tags") or [],
-            "doi": p.get("doi"),
-            "arxiv_id": p.get("arxiv_id"),
-            "url": p.get("url"),
-            "venue": p.get("venue"),
+            "tags": p["tags"],
+            "doi": g("doi"),
+            "arxiv_id": g("arxiv_id"),
+            "url": g("url"),
+            "venue": g("venue"),
         }
         refs = in_corpus_refs.get(pid, [])
         if refs:
@@ -449,9 +611,7 @@ def main():
     }
 
     papers_path = output_dir / "papers.json"
-    with open(papers_path, "w") as f:
-        json.dump(papers_data, f, separators=(",", ":"), ensure_ascii=True)
-        f.write("\n")
+    write_json(papers_path, papers_data)
     print(f"Written: {papers_path} ({len(papers_dict)} papers)")
 
     # --- Write graph.json (unified network) ---
@@ -473,9 +633,9 @@ def main():
 
     graph_node_ids = {n["id"] for n in graph_nodes}
     graph_edges = [
-        {"source": e["source"], "target": e["target"], "type": "paper_cites"}
-        for e in citation_edges
-        if e["source"] in graph_node_ids and e["target"] in graph_node_ids
+        {"source": src, "target": tgt, "type": "paper_cites"}
+        for src, tgt in citation_edges
+        if src in graph_node_ids and tgt in graph_node_ids
     ]
 
     graph_data = {
@@ -491,9 +651,7 @@ def main():
     }
 
     graph_path = output_dir / "graph.json"
-    with open(graph_path, "w") as f:
-        json.dump(graph_data, f, separators=(",", ":"), ensure_ascii=True)
-        f.write("\n")
+    write_json(graph_path, graph_data)
     print(f"Written: {graph_path} ({len(graph_nodes)} nodes, {len(graph_edges)} edges)")
 
     # --- Write coauthor.json ---
@@ -502,9 +660,7 @@ def main():
     print(f"  {len(coauthor_data['nodes'])} authors, {len(coauthor_data['edges'])} edges")
 
     coauthor_path = output_dir / "coauthor.json"
-    with open(coauthor_path, "w") as f:
-        json.dump(coauthor_data, f, separators=(",", ":"), ensure_ascii=True)
-        f.write("\n")
+    write_json(coauthor_path, coauthor_data)
     print(f"Written: {coauthor_path}")
 
     # --- Summary ---
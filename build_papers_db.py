@@ -15,25 +15,81 @@ Usage:
 """
 
 import argparse
+import base64
+import hashlib
+import http.client
 import json
 import math
+import os
 import re
-import subprocess
+import socket
+import ssl
+import threading
 import time
 import urllib.parse
+import urllib.request
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 SEED_PATH = SCRIPT_DIR / "papers-seed.json"
 OUTPUT_PATH = SCRIPT_DIR / "papers-db.json"
+# On-disk cache of raw API responses so re-runs don't re-fetch; None disables it
+# (--no-cache). Entries older than HTTP_CACHE_MAX_AGE seconds are re-fetched
+# (0 with --refresh-cache, which re-fetches everything and rewrites the cache).
+HTTP_CACHE_DIR = SCRIPT_DIR / ".http-cache"
+HTTP_CACHE_MAX_AGE = 7 * 24 * 3600
 
 OPENALEX_BASE = "https://api.openalex.org"
 SEMANTIC_SCHOLAR_BASE = "https://api.semanticscholar.org/graph/v1"
 USER_AGENT = "calcvar-papers-builder/1.0"
 
+# Contact email sent as `mailto` so requests go to OpenAlex's polite pool.
+OPENALEX_EMAIL = os.environ.get("OPENALEX_EMAIL", "")
+
+# Optional fixed address for api.openalex.org when local DNS can't resolve it
+# (see CLAUDE.md); normal DNS resolution is used otherwise.
+RESOLVE_OVERRIDES = {}
+if os.environ.get("OPENALEX_IP"):
+    RESOLVE_OVERRIDES["api.openalex.org"] = os.environ["OPENALEX_IP"]
+
+# OpenAlex allows 10 req/s; stay a little under it across all worker threads.
+OPENALEX_MAX_RPS = 8.0
+OPENALEX_WORKERS = 8
+# Semantic Scholar's unauthenticated batch endpoint tolerates about 1 req/s.
+SEMANTIC_SCHOLAR_MAX_RPS = 1.0
+SEMANTIC_SCHOLAR_WORKERS = 4
+
+# Paper fields only needed while scoring; stripped before papers are emitted.
+SCORING_ONLY_FIELDS = ("abstract_text", "concept_terms", "keyword_terms", "_authors_lower", "_score_text")
+
+# Work fields paper_from_openalex reads; passed as `select` on every /works call.
+WORK_FIELDS = ",".join([
+    "id",
+    "doi",
+    "title",
+    "display_name",
+    "publication_year",
+    "cited_by_count",
+    "type",
+    "ids",
+    "authorships",
+    "primary_location",
+    "abstract_inverted_index",
+    "concepts",
+    "keywords",
+    "referenced_works",
+])
+
 # Calculus of variations search queries.
 KEYWORD_QUERIES = [
     "calculus of variations",
@@ -351,19 +407,40 @@ DOMAIN_TERMS = {
     ],
 }
 
+# Precompiled patterns used by the helpers below.
+_WS_RE = re.compile(r"\s+")
+_DOI_PREFIX_RE = re.compile(r"^https?://(dx\.)?doi\.org/", re.IGNORECASE)
+_ARXIV_PREFIX_RE = re.compile(r"^https?://arxiv\.org/abs/", re.IGNORECASE)
+_OPENALEX_ID_RE = re.compile(r"/([AW]\d+)$")
+_ARXIV_DOI_RE = re.compile(r"10\.48550/arxiv\.", re.IGNORECASE)
+_ARXIV_DOI_ID_RE = re.compile(r"10\.48550/arxiv\.(\d{4}\.\d{4,5})", re.IGNORECASE)
+_TITLE_ESCAPE_RE = re.compile(r"\\[nrt]")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# ASCII-only equivalent of _NON_ALNUM_RE: every non-[a-z0-9] character -> space.
+_NON_ALNUM_TABLE = str.maketrans(
+    {chr(i): " " for i in range(128) if not ("a" <= chr(i) <= "z" or "0" <= chr(i) <= "9")}
+)
+_SHORT_TERM_RE = re.compile(r"[a-z0-9]{1,4}")
+_LEADING_WORD_RE = re.compile(r"\w+")
+_AUTHOR_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_TEXT_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 
 def now_iso():
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
 def normalize_space(text):
-    return re.sub(r"\s+", " ", text or "").strip()
+    return _WS_RE.sub(" ", text or "").strip()
 
 
 def normalize_quotes(text):
     """Replace curly/smart quotes with ASCII equivalents."""
     if not text:
         return text
+    if text.isascii():
+        # Most names and titles are plain ASCII; only the backtick can apply.
+        return text.replace("`", "'")
     return text.replace("\u2018", "'").replace("\u2019", "'").replace(
         "\u201c", '"').replace("\u201d", '"').replace("`", "'")
 
@@ -372,7 +449,7 @@ def normalize_doi(doi):
     if not doi:
         return None
     value = doi.strip()
-    value = re.sub(r"^https?://(dx\.)?doi\.org/", "", value, flags=re.IGNORECASE)
+    value = _DOI_PREFIX_RE.sub("", value)
     value = value.strip().lower()
     return value or None
 
@@ -381,7 +458,7 @@ def normalize_arxiv(arxiv_id):
     if not arxiv_id:
         return None
     value = arxiv_id.strip()
-    value = re.sub(r"^https?://arxiv\.org/abs/", "", value, flags=re.IGNORECASE)
+    value = _ARXIV_PREFIX_RE.sub("", value)
     value = value.lower()
     return value or None
 
@@ -390,7 +467,7 @@ def short_openalex_id(openalex_id):
     if not openalex_id:
         return None
     value = openalex_id.strip()
-    m = re.search(r"/([AW]\d+)$", value)
+    m = _OPENALEX_ID_RE.search(value)
     if m:
         return m.group(1)
     return value
@@ -400,41 +477,283 @@ def invert_abstract(idx):
     """Convert OpenAlex abstract_inverted_index to plain text."""
     if not isinstance(idx, dict) or not idx:
         return ""
-    max_pos = -1
-    for positions in idx.values():
-        if not positions:
-            continue
-        max_pos = max(max_pos, max(positions))
-    if max_pos < 0:
+    placed = [(pos, token) for token, positions in idx.items() if token for pos in positions if pos >= 0]
+    if not placed:
         return ""
+    max_pos = max(pos for pos, _ in placed)
+    if max_pos >= 2 * len(placed):
+        # Sparse (or bogus) positions: order the tokens instead of allocating
+        # a slot per position. Gaps only ever became collapsed whitespace.
+        first = {}
+        for pos, token in placed:
+            first.setdefault(pos, token)
+        return normalize_space(" ".join(first[pos] for pos in sorted(first)))
     words = [""] * (max_pos + 1)
-    for token, positions in idx.items():
-        for pos in positions:
-            if 0 <= pos < len(words) and not words[pos]:
-                words[pos] = token
+    # Fill in reverse so the first token listed for a position wins.
+    for pos, token in reversed(placed):
+        words[pos] = token
     return normalize_space(" ".join(words))
 
 
+def _collapse_non_alnum(text, sep):
+    """Replace runs of characters outside [a-z0-9] with `sep` and trim the ends."""
+    if text.isascii():
+        # translate + split is ~3x faster than the regex for plain ASCII titles.
+        return sep.join(text.translate(_NON_ALNUM_TABLE).split())
+    return _NON_ALNUM_RE.sub(sep, text).strip(sep)
+
+
 def normalize_title_key(title):
     text = (title or "").lower()
     # Strip literal escape sequences from OpenAlex titles (e.g. literal \n, \t).
-    text = re.sub(r"\\[nrt]", " ", text)
-    return re.sub(r"[^a-z0-9]+", " ", text).strip()
+    if "\\" in text:
+        text = _TITLE_ESCAPE_RE.sub(" ", text)
+    return _collapse_non_alnum(text, " ")
+
 
+def _term_pattern(term):
+    """Compile the word-boundary pattern for a term.
 
-def term_in_text(term, text):
-    """Phrase/term matching with word boundaries to avoid substring false positives."""
-    escaped = re.escape(term.lower())
+    The leading boundary is checked by a lookbehind placed after the term's
+    first word rather than before it, so the pattern starts with a literal
+    and re scans for that prefix instead of attempting a match at every
+    position of the text.
+    """
+    term = term.lower()
+    escaped = re.escape(term)
     escaped = escaped.replace(r"\ ", r"[\s\-]+")
-    if re.fullmatch(r"[a-z0-9]{1,4}", term.lower()):
-        pattern = rf"\b{escaped}\b"
+    if _SHORT_TERM_RE.fullmatch(term):
+        before, after = r"\w", r"\b"
     else:
-        pattern = rf"(?<![a-z0-9]){escaped}(?![a-z0-9])"
-    return re.search(pattern, text) is not None
+        before, after = "[a-z0-9]", "(?![a-z0-9])"
+    lead = _LEADING_WORD_RE.match(escaped)
+    if lead is None:
+        return re.compile(rf"(?<!{before}){escaped}{after}")
+    lead = lead.group()
+    return re.compile(rf"{lead}(?<!{before}{lead}){escaped[len(lead):]}{after}")
+
+
+# Terms that count as an explicit calculus-of-variations mention.
+CALCVAR_TERMS = [
+    "calculus of variations",
+    "variational method",
+    "variational problem",
+    "euler-lagrange",
+    "euler lagrange",
+]
+
+# Additional core variational terms (boost, counted per distinct term).
+CORE_VARIATIONAL_TERMS = [
+    "variational inequality",
+    "variational formulation",
+    "variational principle",
+    "minimization problem",
+    "energy functional",
+    "functional minimization",
+]
+
+
+def _prepare_terms(terms):
+    """Pair each distinct term with its [a-z0-9]+ runs and its compiled word-boundary pattern.
+
+    The pattern can only match if every one of those runs also appears as a
+    whole token of the text (the term's own boundaries and separators are all
+    outside [a-z0-9]), so checking the token set first skips almost all regex
+    searches for terms that can't be present.
+    """
+    return tuple(
+        (term, frozenset(_TEXT_TOKEN_RE.findall(term.lower())), _term_pattern(term))
+        for term in dict.fromkeys(terms)
+    )
+
+
+# Built once at import so score_paper does no per-term lowering/escaping/lookups.
+_CALCVAR_PREPARED = _prepare_terms(CALCVAR_TERMS)
+_CORE_VARIATIONAL_PREPARED = _prepare_terms(CORE_VARIATIONAL_TERMS)
+# Every domain term in one flat (domain, needed tokens, pattern) table.
+_DOMAIN_TERM_TABLE = tuple(
+    (domain, needed, pattern)
+    for domain, terms in DOMAIN_TERMS.items()
+    for _, needed, pattern in _prepare_terms(terms)
+)
+
+
+class _PinnedHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that dials a fixed address but keeps SNI/Host."""
+
+    def __init__(self, host, address, timeout):
+        self.ssl_context = ssl.create_default_context()
+        super().__init__(host, timeout=timeout, context=self.ssl_context)
+        self.address = address
+
+    def connect(self):
+        sock = socket.create_connection((self.address, self.port), self.timeout, self.source_address)
+        self.sock = self.ssl_context.wrap_socket(sock, server_hostname=self.host)
+
+
+def _new_connection(netloc, timeout):
+    """Open a connection to an HTTPS host, tunnelling through https_proxy when set.
+
+    Like curl, the proxy comes from https_proxy/HTTPS_PROXY (no_proxy is
+    honoured) and defaults to port 1080. RESOLVE_OVERRIDES only applies to
+    direct connections; through a proxy, the proxy resolves the host.
+    """
+    parts = urllib.parse.urlsplit(f"//{netloc}")
+    host, port = parts.hostname, parts.port or 443
+    proxy = urllib.request.getproxies().get("https")
+    if proxy and not urllib.request.proxy_bypass(host):
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        proxy_parts = urllib.parse.urlsplit(proxy)
+        tunnel_headers = {}
+        if proxy_parts.username:
+            credentials = ":".join(
+                urllib.parse.unquote(v) for v in (proxy_parts.username, proxy_parts.password or "")
+            )
+            tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode()
+        conn = http.client.HTTPSConnection(proxy_parts.hostname, proxy_parts.port or 1080, timeout=timeout)
+        conn.set_tunnel(host, port, headers=tunnel_headers)
+        return conn
+    if host in RESOLVE_OVERRIDES:
+        return _PinnedHTTPSConnection(netloc, RESOLVE_OVERRIDES[host], timeout)
+    return http.client.HTTPSConnection(netloc, timeout=timeout)
+
+
+# One kept-alive connection per host and thread, reused across requests.
+_thread_state = threading.local()
+
+
+class RateLimiter:
+    """Space calls at least 1/rate seconds apart, shared across threads."""
+
+    def __init__(self, rate):
+        self.min_interval = 1.0 / rate
+        self.next_ok = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self.next_ok - now
+            self.next_ok = max(now, self.next_ok) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+_openalex_limiter = RateLimiter(OPENALEX_MAX_RPS)
+_ss_limiter = RateLimiter(SEMANTIC_SCHOLAR_MAX_RPS)
+
+
+def _http_request(method, url, body=None, headers=None, timeout=30, max_redirects=5):
+    """Send a request on the pooled connection for the URL's host; return the body bytes.
+
+    Network errors and non-2xx responses raise; the connection is dropped so the
+    next attempt reconnects. Redirects are followed like curl -L: 307/308
+    repeat the request at the new location, other 3xx codes switch to a GET
+    without a body.
+    """
+    parts = urllib.parse.urlsplit(url)
+    connections = getattr(_thread_state, "connections", None)
+    if connections is None:
+        connections = _thread_state.connections = {}
+    conn = connections.get(parts.netloc)
+    if conn is None:
+        conn = connections[parts.netloc] = _new_connection(parts.netloc, timeout)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    request_headers = {"User-Agent": USER_AGENT, **(headers or {})}
+    try:
+        conn.request(method, target, body=body, headers=request_headers)
+        resp = conn.getresponse()
+        data = resp.read()
+    except (OSError, http.client.HTTPException):
+        conn.close()
+        connections.pop(parts.netloc, None)
+        raise
+    location = urllib.parse.urljoin(url, resp.getheader("Location") or "")
+    if resp.status in (301, 302, 303, 307, 308) and location.startswith("https://") and max_redirects > 0:
+        if resp.status not in (307, 308):
+            method, body = "GET", None
+            headers = {k: v for k, v in (headers or {}).items() if k.lower() != "content-type"}
+        return _http_request(method, location, body, headers, timeout, max_redirects - 1)
+    if not 200 <= resp.status < 300:
+        raise RuntimeError(f"HTTP {resp.status} for {method} {url}")
+    return data
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps_bytes(obj):
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+def write_json(path, data):
+    """Write indented UTF-8 JSON followed by a newline, using orjson when installed.
+
+    Both paths produce the same bytes (non-ASCII unescaped), so the file does
+    not change with the environment; the only spelling difference is for
+    floats below 1e-4 or from 1e16 up, which papers-db.json doesn't contain.
+    """
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        return
+    Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+_cache_write_failed = False
+
+
+def _cache_path(key):
+    return HTTP_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _cache_get(key):
+    """Return the cached, still-fresh response body for key, or None."""
+    if HTTP_CACHE_DIR is None:
+        return None
+    path = _cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime > HTTP_CACHE_MAX_AGE:
+            return None
+        return _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(key, data):
+    """Store a response body. Write errors are reported once and otherwise ignored."""
+    global _cache_write_failed
+    if HTTP_CACHE_DIR is None:
+        return
+    path = _cache_path(key)
+    # Write-then-rename so concurrent fetches never leave a partial entry.
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError as err:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        if not _cache_write_failed:
+            _cache_write_failed = True
+            print(f"  Warning: could not write HTTP cache ({err}); continuing uncached", flush=True)
 
 
 def http_get_json(path, params=None, retries=5, pause=0.15):
     params = params or {}
+    # mailto only affects routing, so it is left out of the cache key.
+    cache_key = f"GET {path}?{urllib.parse.urlencode(params, doseq=True)}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    if OPENALEX_EMAIL:
+        params = {**params, "mailto": OPENALEX_EMAIL}
     query = urllib.parse.urlencode(params, doseq=True)
     url = f"{OPENALEX_BASE}{path}"
     if query:
@@ -442,73 +761,119 @@ def http_get_json(path, params=None, retries=5, pause=0.15):
     last_err = None
 
     for attempt in range(retries + 1):
+        _openalex_limiter.wait()
         try:
-            proc = subprocess.run(
-                [
-                    "curl",
-                    "-fsSL",
-                    "--connect-timeout",
-                    "10",
-                    "--max-time",
-                    "30",
-                    "-A",
-                    USER_AGENT,
-                    "--resolve",
-                    "api.openalex.org:443:104.20.26.229",
-                    url,
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return json.loads(proc.stdout)
+            data = _http_request("GET", url, timeout=30)
+            result = _json_loads(data)
         except Exception as err:  # noqa: BLE001
             last_err = err
             if attempt == retries:
                 break
             backoff = pause * (2 ** attempt)
             time.sleep(backoff)
+            continue
+        _cache_put(cache_key, data)
+        return result
     raise RuntimeError(f"OpenAlex request failed after retries: {url}") from last_err
 
 
 def http_post_json(url, body, retries=5, pause=1.0):
-    """POST JSON to a URL via curl, with retries and exponential backoff."""
-    payload_str = json.dumps(body)
+    """POST JSON to a URL, with retries and exponential backoff.
+
+    The only POST endpoint used is Semantic Scholar's batch API, so every
+    network attempt (retries included) goes through its rate limiter.
+    """
+    payload = _json_dumps_bytes(body)
+    cache_key = f"POST {url}\n{payload.decode()}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
     last_err = None
 
     for attempt in range(retries + 1):
+        _ss_limiter.wait()
         try:
-            proc = subprocess.run(
-                [
-                    "curl",
-                    "-fsSL",
-                    "--connect-timeout",
-                    "10",
-                    "--max-time",
-                    "60",
-                    "-A",
-                    USER_AGENT,
-                    "-H",
-                    "Content-Type: application/json",
-                    "--data",
-                    "@-",
-                    url,
-                ],
-                input=payload_str,
-                check=True,
-                capture_output=True,
-                text=True,
+            data = _http_request(
+                "POST",
+                url,
+                body=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=60,
             )
-            return json.loads(proc.stdout)
+            result = _json_loads(data)
         except Exception as err:  # noqa: BLE001
             last_err = err
             if attempt == retries:
                 break
             backoff = pause * (2 ** attempt)
             time.sleep(backoff)
+            continue
+        _cache_put(cache_key, data)
+        return result
     raise RuntimeError(f"POST request failed after retries: {url}") from last_err
 
 
+def fetch_work_pages(params, max_pages, parsed=None):
+    """Fetch /works pages 1..max_pages for one query, stopping at the first empty page.
+
+    Works are converted with paper_from_openalex as each page arrives, so the
+    raw responses (inverted abstracts, full authorships, ...) are dropped
+    right away instead of being held until the caller consumes them.
+
+    `parsed` optionally maps OpenAlex work IDs to already-converted papers,
+    shared between the fetches of one build: a work returned by several
+    queries is converted once and copied on later hits.
+    Returns (request_count, papers).
+    """
+    papers = []
+    for page in range(1, max_pages + 1):
+        results = http_get_json("/works", {**params, "page": page, "select": WORK_FIELDS}).get("results", [])
+        for work in results:
+            work_id = work.get("id")
+            if parsed is None or not work_id:
+                papers.append(paper_from_openalex(work))
+                continue
+            paper = parsed.get(work_id)
+            if paper is None:
+                paper = parsed[work_id] = paper_from_openalex(work)
+            papers.append(_copy_paper(paper))
+        if not results:
+            return page, papers
+    return max_pages, papers
+
+
+def _copy_paper(paper):
+    """Copy a paper dict and its list fields, so merges into the copy stay local."""
+    if paper is None:
+        return None
+    return {k: list(v) if type(v) is list else v for k, v in paper.items()}
+
+
+def fetch_works_by_ids(openalex_ids, chunk_size=100):
+    """Fetch works by OpenAlex ID, chunk_size IDs per request via the `openalex:` filter.
+
+    OpenAlex OR-filters accept at most 100 values; with per-page set to the
+    chunk length every chunk is a single request. Short IDs (W123...) keep the
+    URL around 1.5 KB at 100 IDs.
+
+    Chunks are fetched concurrently and their results returned in chunk order.
+    A chunk that fails after retries is reported and skipped.
+    """
+    chunks = [openalex_ids[i : i + chunk_size] for i in range(0, len(openalex_ids), chunk_size)]
+
+    def fetch(chunk):
+        ids_filter = "|".join(short_openalex_id(oid) for oid in chunk)
+        params = {"filter": f"openalex:{ids_filter}", "per-page": len(chunk), "select": WORK_FIELDS}
+        try:
+            return http_get_json("/works", params).get("results", [])
+        except RuntimeError as err:
+            print(f"  Warning: OpenAlex ID batch failed: {err}", flush=True)
+            return []
+
+    with ThreadPoolExecutor(max_workers=OPENALEX_WORKERS) as pool:
+        return [work for works in pool.map(fetch, chunks) for work in works]
+
+
 def paper_id_to_ss_id(paper):
     """Convert a paper's canonical ID to Semantic Scholar format.
 
@@ -519,9 +884,9 @@ def paper_id_to_ss_id(paper):
     arxiv_id = paper.get("arxiv_id")
 
     # For arxiv DOIs (10.48550/arxiv.XXXX), extract the arXiv ID directly.
-    if doi and re.match(r"10\.48550/arxiv\.", doi, re.IGNORECASE):
-        extracted = re.sub(r"^10\.48550/arxiv\.", "", doi, flags=re.IGNORECASE)
-        return f"ARXIV:{extracted}"
+    m = _ARXIV_DOI_RE.match(doi) if doi else None
+    if m:
+        return f"ARXIV:{doi[m.end():]}"
 
     if arxiv_id:
         return f"ARXIV:{arxiv_id}"
@@ -549,9 +914,9 @@ def _all_ss_ids_for_paper(paper):
     for alias in paper.get("aliases") or []:
         if alias.startswith("doi:"):
             doi = alias[4:]
-            if re.match(r"10\.48550/arxiv\.", doi, re.IGNORECASE):
-                extracted = re.sub(r"^10\.48550/arxiv\.", "", doi, flags=re.IGNORECASE)
-                ids.add(f"ARXIV:{extracted}")
+            m = _ARXIV_DOI_RE.match(doi)
+            if m:
+                ids.add(f"ARXIV:{doi[m.end():]}")
             else:
                 ids.add(f"DOI:{doi}")
         elif alias.startswith("arxiv:"):
@@ -567,35 +932,40 @@ def ss_batch_citations(papers):
     Queries all known IDs (primary + aliases) and keeps the best result.
     """
     # Build mapping: SS ID -> our paper ID
-    ss_to_ours = {}
-    for paper in papers:
-        for ss_id in _all_ss_ids_for_paper(paper):
-            ss_to_ours[ss_id] = paper["id"]
+    ss_to_ours = {ss_id: paper["id"] for paper in papers for ss_id in _all_ss_ids_for_paper(paper)}
 
     if not ss_to_ours:
         return {}
 
-    ss_ids = list(ss_to_ours.keys())
+    # Sorted so batch contents (and thus retries/logs) are reproducible and
+    # IDs of the same kind are grouped together.
+    ss_ids = sorted(ss_to_ours)
     results = {}
     batch_size = 500
     url = f"{SEMANTIC_SCHOLAR_BASE}/paper/batch"
+    chunks = [ss_ids[i : i + batch_size] for i in range(0, len(ss_ids), batch_size)]
 
-    for i in range(0, len(ss_ids), batch_size):
-        chunk = ss_ids[i : i + batch_size]
-        batch_num = i // batch_size + 1
-        total_batches = (len(ss_ids) + batch_size - 1) // batch_size
-        print(
-            f"  SS batch {batch_num}/{total_batches}: {len(chunk)} papers...",
-            flush=True,
-        )
-
+    def post_batch(chunk):
+        # Batches are posted concurrently; http_post_json rate-limits each attempt.
         try:
-            response = http_post_json(
+            return http_post_json(
                 f"{url}?fields=citationCount,externalIds",
                 {"ids": chunk},
             )
         except RuntimeError as err:
-            print(f"  WARNING: SS batch {batch_num} failed: {err}", flush=True)
+            return err
+
+    with ThreadPoolExecutor(max_workers=SEMANTIC_SCHOLAR_WORKERS) as pool:
+        responses = list(pool.map(post_batch, chunks))
+
+    for batch_num, (chunk, response) in enumerate(zip(chunks, responses), start=1):
+        print(
+            f"  SS batch {batch_num}/{len(chunks)}: {len(chunk)} papers...",
+            flush=True,
+        )
+
+        if isinstance(response, RuntimeError):
+            print(f"  WARNING: SS batch {batch_num} failed: {response}", flush=True)
             continue
 
         if not isinstance(response, list):
@@ -610,23 +980,26 @@ def ss_batch_citations(papers):
             if existing is None or (result.get("citationCount") or 0) > (existing.get("citationCount") or 0):
                 results[our_id] = result
 
-        # Rate limit between batches.
-        if i + batch_size < len(ss_ids):
-            time.sleep(1.0)
-
     return results
 
 
-def enrich_with_semantic_scholar(papers):
+def enrich_with_semantic_scholar(papers, skip_threshold=None):
     """Enrich papers with Semantic Scholar citation counts.
 
     For each paper, stores `ss_cited_by_count` and updates `cited_by_count`
-    to max(openalex, semantic_scholar).
+    to max(openalex, semantic_scholar). Papers whose OpenAlex count is already
+    >= skip_threshold are not looked up and left untouched.
 
     Returns (enriched_count, not_found_count).
     """
     print("Querying Semantic Scholar for citation counts...", flush=True)
 
+    if skip_threshold is not None:
+        skipped = len(papers)
+        papers = [p for p in papers if (p.get("cited_by_count") or 0) < skip_threshold]
+        skipped -= len(papers)
+        print(f"  Skipping {skipped} papers with >= {skip_threshold} OpenAlex citations", flush=True)
+
     ss_results = ss_batch_citations(papers)
 
     enriched = 0
@@ -657,8 +1030,10 @@ def enrich_with_semantic_scholar(papers):
     return enriched, not_found
 
 
+@lru_cache(maxsize=8192)
 def author_name_tokens(name):
-    return [t for t in re.findall(r"[a-z0-9]+", (name or "").lower()) if t]
+    # Tuple so the cached value can't be mutated by callers.
+    return tuple(_AUTHOR_TOKEN_RE.findall((name or "").lower()))
 
 
 def resolve_author(author_name):
@@ -703,7 +1078,7 @@ def canonical_paper_id(doi, arxiv_id, openalex_id, title, year):
         return f"arxiv:{arxiv_id}"
     if openalex_id:
         return f"openalex:{short_openalex_id(openalex_id)}"
-    title_key = re.sub(r"[^a-z0-9]+", "-", (title or "").lower()).strip("-")
+    title_key = _collapse_non_alnum((title or "").lower(), "-")
     return f"title:{title_key}:{year or 'na'}"
 
 
@@ -717,7 +1092,7 @@ def paper_from_openalex(work):
     arxiv_id = normalize_arxiv(ids.get("arxiv"))
     # Fallback: extract arXiv ID from arXiv DOI (10.48550/arXiv.XXXX.XXXXX)
     if not arxiv_id and doi:
-        m = re.match(r"10\.48550/arxiv\.(\d{4}\.\d{4,5})", doi, re.IGNORECASE)
+        m = _ARXIV_DOI_ID_RE.match(doi)
         if m:
             arxiv_id = m.group(1)
     openalex_id = work.get("id") or ids.get("openalex")
@@ -775,6 +1150,8 @@ def paper_from_openalex(work):
         "title": title,
         "year": year,
         "authors": authors,
+        # Lowercased once here for score_paper; dropped before output.
+        "_authors_lower": [a.lower() for a in authors],
         "venue": venue or None,
         "doi": doi,
         "arxiv_id": arxiv_id,
@@ -790,12 +1167,20 @@ def paper_from_openalex(work):
     }
 
 
+def score_text(paper):
+    """Lowercased title + abstract + concept/keyword terms, cached on the paper."""
+    text = paper.get("_score_text")
+    if text is None:
+        title = (paper.get("title") or "").lower()
+        abstract = (paper.get("abstract_text") or "").lower()
+        concepts = " ".join(paper.get("concept_terms") or [])
+        keywords = " ".join(paper.get("keyword_terms") or [])
+        text = paper["_score_text"] = " ".join([title, abstract, concepts, keywords])
+    return text
+
+
 def score_paper(paper, known_researchers, min_year):
-    title = (paper.get("title") or "").lower()
-    abstract = (paper.get("abstract_text") or "").lower()
-    concepts = " ".join(paper.get("concept_terms") or [])
-    keywords = " ".join(paper.get("keyword_terms") or [])
-    text = " ".join([title, abstract, concepts, keywords])
+    text = score_text(paper)
     score = 0.0
     reasons = []
     tags = set()
@@ -805,13 +1190,11 @@ def score_paper(paper, known_researchers, min_year):
         reasons.append("below_min_year")
         return -999.0, reasons, sorted(tags), 0
 
+    tokens = set(_TEXT_TOKEN_RE.findall(text))
+
     # Core calculus of variations terms in title/abstract.
-    has_calcvar = (
-        term_in_text("calculus of variations", text)
-        or term_in_text("variational method", text)
-        or term_in_text("variational problem", text)
-        or term_in_text("euler-lagrange", text)
-        or term_in_text("euler lagrange", text)
+    has_calcvar = any(
+        needed <= tokens and pattern.search(text) for _, needed, pattern in _CALCVAR_PREPARED
     )
     if has_calcvar:
         score += 6.0
@@ -819,15 +1202,11 @@ def score_paper(paper, known_researchers, min_year):
         tags.add("classical_calcvar")
 
     # Additional core variational terms boost.
-    core_variational = [
-        "variational inequality",
-        "variational formulation",
-        "variational principle",
-        "minimization problem",
-        "energy functional",
-        "functional minimization",
-    ]
-    core_matches = sum(1 for t in core_variational if term_in_text(t, text))
+    core_matches = sum(
+        1
+        for _, needed, pattern in _CORE_VARIATIONAL_PREPARED
+        if needed <= tokens and pattern.search(text)
+    )
     if core_matches > 0:
         core_pts = min(4.0, 1.5 * core_matches)
         score += core_pts
@@ -835,24 +1214,27 @@ def score_paper(paper, known_researchers, min_year):
         tags.add("classical_calcvar")
 
     # Domain-specific term matching.
+    # Prepared term lists are distinct, so hits counts distinct matching terms.
+    hits = Counter(
+        domain
+        for domain, needed, pattern in _DOMAIN_TERM_TABLE
+        if needed <= tokens and pattern.search(text)
+    )
     matched_domains = 0
-    for domain, terms in DOMAIN_TERMS.items():
-        matches = []
-        for term in terms:
-            if term_in_text(term, text):
-                matches.append(term)
-        if matches:
+    for domain in DOMAIN_TERMS:
+        if hits[domain]:
             matched_domains += 1
             tags.add(domain)
-            domain_points = min(3.0, 0.8 * len(set(matches)))
+            domain_points = min(3.0, 0.8 * hits[domain])
             score += domain_points
             reasons.append(f"domain_{domain}(+{domain_points:.1f})")
 
     # Known researcher boost.
-    matched_authors = []
-    for author in paper.get("authors", []):
-        if author.lower() in known_researchers:
-            matched_authors.append(author)
+    authors = paper.get("authors", [])
+    authors_lower = paper.get("_authors_lower")
+    if authors_lower is None:
+        authors_lower = [a.lower() for a in authors]
+    matched_authors = [a for a, al in zip(authors, authors_lower) if al in known_researchers]
     if matched_authors:
         author_points = min(6.0, 2.0 * len(set(matched_authors)))
         score += author_points
@@ -916,9 +1298,10 @@ def merge_seed(seed_path):
     return out
 
 
+@lru_cache(maxsize=16384)
 def _is_arxiv_doi(doi):
     """True if the DOI is an arXiv preprint DOI (10.48550/arxiv.xxx)."""
-    return bool(doi and re.match(r"10\.48550/arxiv\.", doi, re.IGNORECASE))
+    return bool(doi and _ARXIV_DOI_RE.match(doi))
 
 
 def merge_paper_rows(existing, incoming):
@@ -930,32 +1313,29 @@ def merge_paper_rows(existing, incoming):
     both_urls = [u for u in (existing.get("url"), incoming.get("url")) if u]
     both_venues = [v for v in (existing.get("venue"), incoming.get("venue")) if v]
 
+    # Aliases are collected in one set and sorted into the row once, at the end.
+    aliases = {*(existing.get("aliases") or ()), *(incoming.get("aliases") or ())}
     if (incoming.get("relevance_score") or 0) > (existing.get("relevance_score") or 0):
         # Keep stronger row as base but preserve existing id aliases.
-        base = dict(incoming)
-        aliases = set(existing.get("aliases") or [])
         aliases.add(existing.get("id"))
-        aliases.update(incoming.get("aliases") or [])
-        base["aliases"] = sorted(a for a in aliases if a and a != base.get("id"))
+        base = dict(incoming)
         existing.clear()
         existing.update(base)
     else:
-        aliases = set(existing.get("aliases") or [])
         aliases.add(incoming.get("id"))
-        aliases.update(incoming.get("aliases") or [])
-        existing["aliases"] = sorted(a for a in aliases if a and a != existing.get("id"))
+    aliases.discard(existing.get("id"))
+    existing.setdefault("aliases", [])  # keeps the key where it has always been in the row
 
     existing["cited_by_count"] = max(existing.get("cited_by_count") or 0, incoming.get("cited_by_count") or 0)
     existing["ss_cited_by_count"] = max(existing.get("ss_cited_by_count") or 0, incoming.get("ss_cited_by_count") or 0)
     existing["relevance_score"] = max(existing.get("relevance_score") or 0, incoming.get("relevance_score") or 0)
 
     # Keep richer referenced_works list
-    if len(incoming.get("referenced_works") or []) > len(existing.get("referenced_works") or []):
+    if len(incoming.get("referenced_works") or ()) > len(existing.get("referenced_works") or ()):
         existing["referenced_works"] = incoming["referenced_works"]
 
     for k in ("authors", "tags", "relevance_reasons", "matched_queries", "source_types"):
-        vals = set(existing.get(k) or [])
-        vals.update(incoming.get(k) or [])
+        vals = {*(existing.get(k) or ()), *(incoming.get(k) or ())}
         existing[k] = sorted(v for v in vals if v)
 
     # Prefer the published (non-arXiv) DOI when merging preprint + published.
@@ -983,11 +1363,10 @@ def merge_paper_rows(existing, incoming):
     new_oa = existing.get("openalex_id")
     new_id = canonical_paper_id(new_doi, new_arxiv, new_oa, existing.get("title"), existing.get("year"))
     if new_id != existing.get("id"):
-        aliases = set(existing.get("aliases") or [])
         aliases.add(existing["id"])
         aliases.discard(new_id)
-        existing["aliases"] = sorted(a for a in aliases if a)
         existing["id"] = new_id
+    existing["aliases"] = sorted(a for a in aliases if a)
 
     return existing
 
@@ -995,24 +1374,28 @@ def merge_paper_rows(existing, incoming):
 def dedupe_accepted_papers(papers):
     deduped = {}
     for paper in papers:
-        key = normalize_title_key(paper.get("title") or "")
-        if key not in deduped:
+        # Cached on the paper: build_database dedupes the same rows more than once.
+        key = paper.get("_title_key")
+        if key is None:
+            key = paper["_title_key"] = normalize_title_key(paper.get("title") or "")
+        existing = deduped.get(key)
+        if existing is None:
             deduped[key] = paper
         else:
-            deduped[key] = merge_paper_rows(deduped[key], paper)
+            deduped[key] = merge_paper_rows(existing, paper)
     return list(deduped.values())
 
 
 def build_database(min_score, min_year, query_pages, author_pages, per_page):
-    known_researchers = set()
-    for name in AUTHOR_SEEDS:
-        known_researchers.add(name.lower())
-
     # Include researchers from seed authors to widen coverage.
     seed_rows = merge_seed(SEED_PATH)
-    for p in seed_rows.values():
-        for name in p.get("authors", []):
-            known_researchers.add(name.lower())
+    # Author discovery starts with explicit seeds plus seed-paper authors.
+    # Normalize quotes so e.g. D'Amato and D\u2019Amato don't create duplicates;
+    # paper authors are normalized the same way, so known-researcher matching
+    # uses these names too.
+    author_names = {normalize_quotes(n) for n in AUTHOR_SEEDS}
+    author_names.update(normalize_quotes(a) for p in seed_rows.values() for a in p.get("authors", ()) if a)
+    known_researchers = frozenset(name.lower() for name in author_names)
 
     work_candidates = {}
 
@@ -1026,11 +1409,20 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
                 "paper": paper,
                 "source_types": {source_type},
                 "source_labels": {source_label},
+                # Membership sets for the paper's list fields, kept in step with
+                # the lists so repeat upserts don't rebuild them.
+                "authors": set(paper.get("authors") or ()),
+                "concept_terms": set(paper.get("concept_terms") or ()),
+                "keyword_terms": set(paper.get("keyword_terms") or ()),
+                # Set to None once a second OpenAlex work merges into this row.
+                "openalex_id": paper.get("openalex_id"),
             }
             return
 
         entry["source_types"].add(source_type)
         entry["source_labels"].add(source_label)
+        if entry["openalex_id"] != paper.get("openalex_id"):
+            entry["openalex_id"] = None
 
         # Keep better metadata when available.
         existing = entry["paper"]
@@ -1038,8 +1430,9 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
             existing["cited_by_count"] = paper.get("cited_by_count")
         if not existing.get("abstract_text") and paper.get("abstract_text"):
             existing["abstract_text"] = paper["abstract_text"]
+            existing.pop("_score_text", None)
         # Keep richer referenced_works list
-        if len(paper.get("referenced_works") or []) > len(existing.get("referenced_works") or []):
+        if len(paper.get("referenced_works") or ()) > len(existing.get("referenced_works") or ()):
             existing["referenced_works"] = paper["referenced_works"]
         if not existing.get("venue") and paper.get("venue"):
             existing["venue"] = paper["venue"]
@@ -1048,120 +1441,111 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
         if not existing.get("openalex_id") and paper.get("openalex_id"):
             existing["openalex_id"] = paper["openalex_id"]
 
-        existing_authors = set(existing.get("authors") or [])
-        for a in paper.get("authors") or []:
+        existing_authors = entry["authors"]
+        for a in paper.get("authors") or ():
             if a not in existing_authors:
                 existing.setdefault("authors", []).append(a)
+                existing.setdefault("_authors_lower", []).append(a.lower())
                 existing_authors.add(a)
 
-        existing_concepts = set(existing.get("concept_terms") or [])
-        for c in paper.get("concept_terms") or []:
+        existing_concepts = entry["concept_terms"]
+        for c in paper.get("concept_terms") or ():
             if c not in existing_concepts:
                 existing.setdefault("concept_terms", []).append(c)
                 existing_concepts.add(c)
+                existing.pop("_score_text", None)
 
-        existing_keywords = set(existing.get("keyword_terms") or [])
-        for k in paper.get("keyword_terms") or []:
+        existing_keywords = entry["keyword_terms"]
+        for k in paper.get("keyword_terms") or ():
             if k not in existing_keywords:
                 existing.setdefault("keyword_terms", []).append(k)
                 existing_keywords.add(k)
+                existing.pop("_score_text", None)
 
-    work_select = ",".join([
-        "id",
-        "doi",
-        "title",
-        "display_name",
-        "publication_year",
-        "cited_by_count",
-        "type",
-        "ids",
-        "authorships",
-        "primary_location",
-        "abstract_inverted_index",
-        "concepts",
-        "keywords",
-        "referenced_works",
-    ])
-
-    print("Fetching keyword-based candidates from OpenAlex...", flush=True)
-    keyword_requests = 0
-    for q_idx, query in enumerate(KEYWORD_QUERIES, start=1):
-        print(f"  query {q_idx}/{len(KEYWORD_QUERIES)}: {query}", flush=True)
-        for page in range(1, query_pages + 1):
-            payload = http_get_json(
-                "/works",
+    # Queries and authors are fetched concurrently (pages within one query stay
+    # sequential); results are consumed in submission order so the output does
+    # not depend on network timing. Author resolution doesn't depend on the
+    # keyword results, so it is queued right behind the keyword fetches.
+    pool = ThreadPoolExecutor(max_workers=OPENALEX_WORKERS)
+    try:
+        parsed_works = {}  # OpenAlex work ID -> converted paper, see fetch_work_pages
+
+        print("Fetching keyword-based candidates from OpenAlex...", flush=True)
+        keyword_requests = 0
+        keyword_pages = pool.map(
+            lambda query: fetch_work_pages(
                 {
                     "search": query,
-                    "page": page,
                     "per-page": per_page,
                     "filter": f"from_publication_date:{min_year}-01-01",
-                    "select": work_select,
                 },
-            )
-            keyword_requests += 1
-            for raw_work in payload.get("results", []):
-                paper = paper_from_openalex(raw_work)
+                query_pages,
+                parsed_works,
+            ),
+            KEYWORD_QUERIES,
+        )
+        sorted_names = sorted(author_names)
+        resolutions = pool.map(resolve_author, sorted_names)
+
+        for q_idx, (query, (requests, papers)) in enumerate(zip(KEYWORD_QUERIES, keyword_pages), start=1):
+            print(f"  query {q_idx}/{len(KEYWORD_QUERIES)}: {query}", flush=True)
+            keyword_requests += requests
+            for paper in papers:
                 upsert_candidate(paper, "keyword", query)
-            if not payload.get("results"):
-                break
-            time.sleep(0.12)
 
-    print(f"  Keyword requests: {keyword_requests}", flush=True)
-    print(f"  Candidates after keyword phase: {len(work_candidates)}", flush=True)
+        print(f"  Keyword requests: {keyword_requests}", flush=True)
+        print(f"  Candidates after keyword phase: {len(work_candidates)}", flush=True)
 
-    # Author discovery starts with explicit seeds plus seed-paper authors.
-    # Normalize quotes so e.g. D'Amato and D\u2019Amato don't create duplicates.
-    author_names = set(normalize_quotes(n) for n in AUTHOR_SEEDS)
-    for p in seed_rows.values():
-        for a in p.get("authors", []):
-            if a:
-                author_names.add(normalize_quotes(a))
-
-    print("Resolving author seeds...", flush=True)
-    resolved_authors = {}
-    seen_author_ids = {}  # OpenAlex author ID -> first seed name
-    for name in sorted(author_names):
-        resolved = resolve_author(name)
-        if not resolved:
-            continue
-        author_id = short_openalex_id(resolved.get("id"))
-        if not author_id:
-            continue
-        # Skip if we already resolved this OpenAlex author under a different name.
-        if author_id in seen_author_ids:
-            continue
-        seen_author_ids[author_id] = name
-        resolved_authors[name] = {
-            "id": author_id,
-            "display_name": resolved.get("display_name"),
-        }
-        time.sleep(0.08)
-
-    print(f"  Resolved authors: {len(resolved_authors)}", flush=True)
-
-    print("Fetching author-based candidates from OpenAlex...", flush=True)
-    author_requests = 0
-    for a_idx, (seed_name, author) in enumerate(resolved_authors.items(), start=1):
-        print(f"  author {a_idx}/{len(resolved_authors)}: {seed_name}", flush=True)
-        author_id = author["id"]
-        for page in range(1, author_pages + 1):
-            payload = http_get_json(
-                "/works",
+        def fetch_author_works(author_id):
+            return fetch_work_pages(
                 {
                     "filter": f"authorships.author.id:{author_id},from_publication_date:{min_year}-01-01",
                     "sort": "cited_by_count:desc",
-                    "page": page,
                     "per-page": per_page,
-                    "select": work_select,
                 },
+                author_pages,
+                parsed_works,
             )
-            author_requests += 1
-            for raw_work in payload.get("results", []):
-                paper = paper_from_openalex(raw_work)
+
+        print("Resolving author seeds...", flush=True)
+        resolved_authors = {}
+        # Each author's works are queued as soon as the author is resolved.
+        author_works = []
+        seen_author_ids = {}  # OpenAlex author ID -> first seed name
+        for name, resolved in zip(sorted_names, resolutions):
+            if not resolved:
+                continue
+            author_id = short_openalex_id(resolved.get("id"))
+            if not author_id:
+                continue
+            # Skip if we already resolved this OpenAlex author under a different name.
+            if author_id in seen_author_ids:
+                continue
+            seen_author_ids[author_id] = name
+            resolved_authors[name] = {
+                "id": author_id,
+                "display_name": resolved.get("display_name"),
+            }
+            author_works.append(pool.submit(fetch_author_works, author_id))
+
+        print(f"  Resolved authors: {len(resolved_authors)}", flush=True)
+
+        print("Fetching author-based candidates from OpenAlex...", flush=True)
+        author_requests = 0
+        for a_idx, (seed_name, future) in enumerate(zip(resolved_authors, author_works), start=1):
+            print(f"  author {a_idx}/{len(resolved_authors)}: {seed_name}", flush=True)
+            requests, papers = future.result()
+            author_requests += requests
+            for paper in papers:
                 upsert_candidate(paper, "author", seed_name)
-            if not payload.get("results"):
-                break
-            time.sleep(0.12)
+    finally:
+        # Drop queued fetches if a phase fails (or on Ctrl-C) instead of
+        # letting interpreter exit wait for all of them.
+        pool.shutdown(cancel_futures=True)
+    # The fetches were the only users of the conversion memo, and the finished
+    # futures still hold every converted page; release both before scoring.
+    parsed_works.clear()
+    author_works.clear()
 
     print(f"  Author requests: {author_requests}", flush=True)
     print(f"  Candidates after author phase: {len(work_candidates)}", flush=True)
@@ -1171,19 +1555,25 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
     rejected = 0
     domain_counter = Counter()
     source_counter = Counter()
+    # Scores of candidates built from a single OpenAlex work, keyed by paper ID.
+    # Citation expansion often re-fetches rejected candidates; when the fetched
+    # work is the same one, its score is reused instead of recomputed.
+    score_cache = {}
 
     for entry in work_candidates.values():
         paper = entry["paper"]
-        score, reasons, tags, matched_domains = score_paper(paper, known_researchers, min_year=min_year)
+        scored = score_paper(paper, known_researchers, min_year=min_year)
+        if entry["openalex_id"]:
+            score_cache[paper["id"]] = (entry["openalex_id"], scored)
+        score, reasons, tags, matched_domains = scored
         paper["relevance_score"] = round(score, 3)
         paper["relevance_reasons"] = reasons
-        paper["tags"] = sorted(set(tags))
+        paper["tags"] = tags  # score_paper already returns sorted, distinct tags
         paper["matched_queries"] = sorted(entry["source_labels"])
         paper["source_types"] = sorted(entry["source_types"])
         paper["source"] = "openalex"
-        paper.pop("abstract_text", None)
-        paper.pop("concept_terms", None)
-        paper.pop("keyword_terms", None)
+        for field in SCORING_ONLY_FIELDS:
+            paper.pop(field, None)
 
         # Keep only papers with meaningful calcvar/domain evidence.
         # Seed authors are trusted — accept with lower score threshold.
@@ -1202,25 +1592,18 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
             continue
 
         accepted.append(paper)
-        source_counter.update(paper.get("source_types") or [])
-        domain_counter.update(t for t in paper.get("tags", []) if t in DOMAIN_TERMS)
+        source_counter.update(paper.get("source_types") or ())
+        domain_counter.update(t for t in paper.get("tags", ()) if t in DOMAIN_TERMS)
 
     # Merge curated seed rows unconditionally.
+    accepted_by_id = {p["id"]: p for p in accepted}
     for seed_pid, seed_paper in seed_rows.items():
-        existing = None
-        for p in accepted:
-            if p["id"] == seed_pid:
-                existing = p
-                break
+        existing = accepted_by_id.get(seed_pid)
         if existing:
-            existing_tags = set(existing.get("tags") or [])
-            existing_tags.update(seed_paper.get("tags") or [])
-            existing["tags"] = sorted(existing_tags)
+            existing["tags"] = sorted({*(existing.get("tags") or ()), *(seed_paper.get("tags") or ())})
             existing["seed"] = True
             existing["source"] = "seed+openalex"
-            reasons = set(existing.get("relevance_reasons") or [])
-            reasons.add("curated_seed")
-            existing["relevance_reasons"] = sorted(reasons)
+            existing["relevance_reasons"] = sorted({*(existing.get("relevance_reasons") or ()), "curated_seed"})
             # Preserve useful seed metadata that OA might lack
             if not existing.get("arxiv_id") and seed_paper.get("arxiv_id"):
                 existing["arxiv_id"] = seed_paper["arxiv_id"]
@@ -1234,107 +1617,99 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
         seeded["matched_queries"] = []
         seeded["source_types"] = ["seed"]
         accepted.append(seeded)
+        accepted_by_id[seeded["id"]] = seeded
         source_counter.update(["seed"])
-        domain_counter.update(t for t in seeded.get("tags", []) if t in DOMAIN_TERMS)
+        domain_counter.update(t for t in seeded.get("tags", ()) if t in DOMAIN_TERMS)
 
     accepted = dedupe_accepted_papers(accepted)
+    accepted_by_id = {p["id"]: p for p in accepted}
 
     # ------------------------------------------------------------------
     # Citation expansion: discover papers our corpus cites frequently
     # but that weren't found by keyword/author search.
     # ------------------------------------------------------------------
     print("Citation expansion: finding frequently-cited missing papers...", flush=True)
+    # referenced_works holds short IDs (paper_from_openalex shortens them), so
+    # only the short form of each accepted paper's ID is needed here.
     accepted_oa_ids = set()
     for p in accepted:
-        oa = p.get("openalex_id", "")
+        oa = p.get("openalex_id")
         if oa:
             short = short_openalex_id(oa)
             if short:
                 accepted_oa_ids.add(short)
-            accepted_oa_ids.add(oa)
 
     # Count how many corpus papers cite each external paper
-    external_ref_counts = Counter()
-    for p in accepted:
-        for ref_oa_id in p.get("referenced_works") or []:
-            if ref_oa_id not in accepted_oa_ids:
-                external_ref_counts[ref_oa_id] += 1
+    external_ref_counts = Counter(
+        ref_oa_id
+        for p in accepted
+        for ref_oa_id in p.get("referenced_works") or ()
+        if ref_oa_id not in accepted_oa_ids
+    )
 
     # Papers cited by >= CITATION_EXPANSION_MIN corpus papers get auto-added
     CITATION_EXPANSION_MIN = 3
+    # Filter before sorting: most_common() would sort every referenced work.
+    # The sort is stable, so ties keep first-seen order as with most_common().
     expansion_ids = [
-        oa_id for oa_id, count in external_ref_counts.most_common()
+        oa_id for oa_id, count in external_ref_counts.items()
         if count >= CITATION_EXPANSION_MIN
     ]
+    expansion_ids.sort(key=external_ref_counts.__getitem__, reverse=True)
     print(f"  {len(expansion_ids)} external papers cited by >={CITATION_EXPANSION_MIN} corpus papers", flush=True)
 
     if expansion_ids:
         expansion_added = 0
-        # Batch-fetch from OpenAlex in chunks of 50
-        for chunk_start in range(0, len(expansion_ids), 50):
-            chunk = expansion_ids[chunk_start:chunk_start + 50]
-            ids_filter = "|".join(f"https://openalex.org/{oid}" for oid in chunk)
-            try:
-                cursor = "*"
-                while cursor:
-                    data = http_get_json(
-                        "/works",
-                        {
-                            "filter": f"openalex:{ids_filter}",
-                            "select": work_select,
-                            "per_page": 200,
-                            "cursor": cursor,
-                        },
-                    )
-                    for work in data.get("results", []):
-                        paper = paper_from_openalex(work)
-                        if not paper:
-                            continue
-                        # Check if already in accepted by ID
-                        if any(a["id"] == paper["id"] for a in accepted):
-                            continue
-                        # Relevance gate: must have some calcvar signal
-                        score, reasons, tags, matched_domains = score_paper(
-                            paper, known_researchers, min_year,
-                        )
-                        has_calcvar = any("mentions_calcvar" in r for r in reasons)
-                        if not has_calcvar and matched_domains < 2:
-                            continue  # skip weakly related papers
-                        cite_count = external_ref_counts.get(
-                            short_openalex_id(work.get("id")), 0
-                        )
-                        paper["relevance_score"] = max(
-                            float(min_score),
-                            min(30.0, cite_count * 2.0),
-                        )
-                        paper["relevance_reasons"] = [
-                            f"citation_expansion(cited_by={cite_count})"
-                        ] + reasons
-                        paper["tags"] = sorted(
-                            set(tags) | {"citation-expanded"}
-                        )
-                        paper["matched_queries"] = []
-                        paper["source_types"] = ["citation_expansion"]
-                        paper["source"] = "citation_expansion"
-                        paper.pop("abstract_text", None)
-                        paper.pop("concept_terms", None)
-                        paper.pop("keyword_terms", None)
-                        accepted.append(paper)
-                        expansion_added += 1
-                        # Track the new OA ID to avoid re-fetching
-                        new_short = short_openalex_id(work.get("id"))
-                        if new_short:
-                            accepted_oa_ids.add(new_short)
-                    cursor = (data.get("meta") or {}).get("next_cursor")
-                    if not data.get("results"):
-                        break
-            except Exception as err:
-                print(f"  Warning: expansion batch failed: {err}", flush=True)
-
-        accepted = dedupe_accepted_papers(accepted)
+        for work in fetch_works_by_ids(expansion_ids):
+            work_short = short_openalex_id(work.get("id"))
+            paper = paper_from_openalex(work)
+            if not paper:
+                continue
+            # Check if already in accepted by ID
+            if paper["id"] in accepted_by_id:
+                continue
+            # Relevance gate: must have some calcvar signal
+            cached = score_cache.get(paper["id"])
+            if cached and cached[0] == paper.get("openalex_id"):
+                scored = cached[1]
+            else:
+                scored = score_paper(paper, known_researchers, min_year)
+            score, reasons, tags, matched_domains = scored
+            has_calcvar = any("mentions_calcvar" in r for r in reasons)
+            if not has_calcvar and matched_domains < 2:
+                continue  # skip weakly related papers
+            cite_count = external_ref_counts.get(work_short, 0)
+            paper["relevance_score"] = max(
+                float(min_score),
+                min(30.0, cite_count * 2.0),
+            )
+            paper["relevance_reasons"] = [
+                f"citation_expansion(cited_by={cite_count})"
+            ] + reasons
+            paper["tags"] = sorted(
+                set(tags) | {"citation-expanded"}
+            )
+            paper["matched_queries"] = []
+            paper["source_types"] = ["citation_expansion"]
+            paper["source"] = "citation_expansion"
+            for field in SCORING_ONLY_FIELDS:
+                paper.pop(field, None)
+            accepted.append(paper)
+            accepted_by_id[paper["id"]] = paper
+            expansion_added += 1
+            # Track the new OA ID to avoid re-fetching
+            if work_short:
+                accepted_oa_ids.add(work_short)
+
+        # accepted is already deduped; only new expansion rows can collide.
+        if expansion_added:
+            accepted = dedupe_accepted_papers(accepted)
         print(f"  Added {expansion_added} papers via citation expansion", flush=True)
         source_counter.update({"citation_expansion": expansion_added})
 
+    for p in accepted:
+        p.pop("_title_key", None)
+
     accepted.sort(
         key=lambda p: (
             -(p.get("relevance_score") or 0),
@@ -1380,6 +1755,7 @@ def build_database(min_score, min_year, query_pages, author_pages, per_page):
 
 
 def main():
+    global HTTP_CACHE_DIR, HTTP_CACHE_MAX_AGE
     parser = argparse.ArgumentParser()
     parser.add_argument("--output", default=str(OUTPUT_PATH), help="Output JSON path")
     parser.add_argument("--min-score", type=float, default=8.0, help="Minimum relevance score")
@@ -1392,8 +1768,29 @@ def main():
         action="store_true",
         help="Skip Semantic Scholar citation enrichment",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the HTTP response cache (.http-cache/)",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached HTTP responses but store the fresh ones",
+    )
+    parser.add_argument(
+        "--ss-skip-threshold",
+        type=int,
+        default=None,
+        help="Don't query Semantic Scholar for papers with at least this many OpenAlex citations",
+    )
     args = parser.parse_args()
 
+    if args.no_cache:
+        HTTP_CACHE_DIR = None
+    elif args.refresh_cache:
+        HTTP_CACHE_MAX_AGE = 0
+
     output_path = Path(args.output)
     payload = build_database(
         min_score=args.min_score,
@@ -1405,16 +1802,18 @@ def main():
 
     # Semantic Scholar enrichment (after all OpenAlex collection and dedup).
     if not args.skip_ss:
-        ss_enriched, ss_not_found = enrich_with_semantic_scholar(payload["papers"])
+        ss_enriched, ss_not_found = enrich_with_semantic_scholar(
+            payload["papers"], skip_threshold=args.ss_skip_threshold,
+        )
         payload["config"]["semantic_scholar"] = True
+        if args.ss_skip_threshold is not None:
+            payload["config"]["ss_skip_threshold"] = args.ss_skip_threshold
         payload["stats"]["ss_enriched"] = ss_enriched
         payload["stats"]["ss_not_found"] = ss_not_found
     else:
         print("Skipping Semantic Scholar enrichment (--skip-ss)", flush=True)
 
-    with open(output_path, "w") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=True)
-        f.write("\n")
+    write_json(output_path, payload)
 
     stats = payload["stats"]
     print(f"Written: {output_path}")
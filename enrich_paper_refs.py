@@ -20,6 +20,8 @@ import time
 import urllib.parse
 from pathlib import Path
 
+from build_papers_db import write_json
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PAPERS_DB_PATH = SCRIPT_DIR / "papers-db.json"
 OPENALEX_BASE = "https://api.openalex.org"
@@ -147,7 +149,7 @@ def main():
     args = parser.parse_args()
 
     print("Loading papers-db.json...")
-    with open(PAPERS_DB_PATH) as f:
+    with open(PAPERS_DB_PATH, encoding="utf-8") as f:
         payload = json.load(f)
 
     papers = payload.get("papers", [])
@@ -432,9 +434,7 @@ def main():
 
     # Write back
     print("Writing papers-db.json...")
-    with open(PAPERS_DB_PATH, "w") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=True)
-        f.write("\n")
+    write_json(PAPERS_DB_PATH, payload)
     print("Done!")
 
 